@@ -200,6 +200,26 @@ def map_config(config):
         ).date(),
         "SESSION_COOKIE_SECURE": config.getboolean("default", "SESSION_COOKIE_SECURE"),
         "ALLOW_LOCAL_ACCESS": config.getboolean("default", "ALLOW_LOCAL_ACCESS"),
+        "AZURE_CREDENTIAL_CACHE_SIZE": config.getint(
+            "default", "AZURE_CREDENTIAL_CACHE_SIZE"
+        ),
+        "AZURE_CREDENTIAL_CACHE_TTL": config.getint(
+            "default", "AZURE_CREDENTIAL_CACHE_TTL"
+        ),
+        "AZURE_HTTP_MAX_RETRIES": config.getint("default", "AZURE_HTTP_MAX_RETRIES"),
+        "AZURE_HTTP_POOL_CONNECTIONS": config.getint(
+            "default", "AZURE_HTTP_POOL_CONNECTIONS"
+        ),
+        "AZURE_HTTP_POOL_MAXSIZE": config.getint("default", "AZURE_HTTP_POOL_MAXSIZE"),
+        "AZURE_MGMT_GROUP_POLL_BY_RESCHEDULE": config.getboolean(
+            "default", "AZURE_MGMT_GROUP_POLL_BY_RESCHEDULE"
+        ),
+        "AZURE_TOKEN_CACHE_REDIS": config.getboolean(
+            "default", "AZURE_TOKEN_CACHE_REDIS"
+        ),
+        "AZURE_TOKEN_EXPIRY_MARGIN": config.getint(
+            "default", "AZURE_TOKEN_EXPIRY_MARGIN"
+        ),
     }
 
 
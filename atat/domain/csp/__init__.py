@@ -6,15 +6,15 @@ from .reports import MockReportingProvider
 
 
 class CSP:
-    def __init__(self, csp, config, **kwargs):
+    def __init__(self, csp, config, redis=None, **kwargs):
         if csp == "azure":
-            self.cloud = AzureCloudProvider(config)
+            self.cloud = AzureCloudProvider(config, redis=redis)
             self.files = AzureFileService(config)
         elif csp in ("mock-test", "mock"):
             self.cloud = MockCloudProvider(config, **kwargs)
             self.files = MockFileService(config)
         elif csp == "hybrid":
-            azure = AzureCloudProvider(config)
+            azure = AzureCloudProvider(config, redis=redis)
             mock = MockCloudProvider(config, **kwargs)
             self.cloud = HybridCloudProvider(azure, mock, config)
             self.files = AzureFileService(config)
@@ -30,6 +30,7 @@ def make_csp_provider(app, csp=None):
     app.csp = CSP(
         csp,
         app.config,
+        redis=app.redis,
         with_delay=simulate_failures,
         with_failure=simulate_failures,
         with_authorization=simulate_failures,
@@ -13,6 +13,7 @@ from flask import current_app as app
 from atat.utils import sha256_hex
 
 from .cloud_provider_interface import CloudProviderInterface
+from .credential_cache import DEFAULT_MAXSIZE, DEFAULT_TTL, CredentialCache
 from .exceptions import (
     AuthenticationException,
     ConnectionException,
@@ -45,6 +46,8 @@ from .models import (
     InitialMgmtGroupVerificationCSPPayload,
     InitialMgmtGroupVerificationCSPResult,
     KeyVaultCredentials,
+    ManagementGroupCreationStatusCSPPayload,
+    ManagementGroupCSPResponse,
     PoliciesCSPPayload,
     PoliciesCSPResult,
     PrincipalAdminRoleCSPPayload,
@@ -85,6 +88,13 @@ from .models import (
     class_to_stage,
 )
 from .policy import AzurePolicyManager
+from .sessions import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    PooledRequests,
+)
+from .token_cache import DEFAULT_EXPIRY_MARGIN, TokenCache
 from .utils import (
     OFFICE_365_DOMAIN,
     create_active_directory_user,
@@ -162,14 +172,22 @@ def log_and_raise_exceptions(func):
 
 
 class AzureSDKProvider(object):
-    def __init__(self):
-        import requests
+    def __init__(self, config=None):
         from msrestazure.azure_cloud import (  # TODO: choose cloud type from config
             AZURE_PUBLIC_CLOUD,
         )
 
+        config = config or {}
         self.cloud = AZURE_PUBLIC_CLOUD
-        self.requests = requests
+        self.requests = PooledRequests(
+            pool_connections=int(
+                config.get("AZURE_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+            ),
+            pool_maxsize=int(
+                config.get("AZURE_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)
+            ),
+            max_retries=int(config.get("AZURE_HTTP_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        )
 
 
 class AsyncOperationStatus(Enum):
@@ -182,7 +200,7 @@ class AsyncOperationStatus(Enum):
 
 
 class AzureCloudProvider(CloudProviderInterface):
-    def __init__(self, config, azure_sdk_provider=None):
+    def __init__(self, config, azure_sdk_provider=None, redis=None):
         self.config = config
 
         self.client_id = config["AZURE_CLIENT_ID"]
@@ -200,12 +218,26 @@ class AzureCloudProvider(CloudProviderInterface):
         }
 
         if azure_sdk_provider is None:
-            self.sdk = AzureSDKProvider()
+            self.sdk = AzureSDKProvider(config)
         else:
             self.sdk = azure_sdk_provider
 
         self.policy_manager = AzurePolicyManager(config["AZURE_POLICY_LOCATION"])
 
+        self.token_cache = TokenCache(
+            redis=redis if config.get("AZURE_TOKEN_CACHE_REDIS") else None,
+            expiry_margin=int(
+                config.get("AZURE_TOKEN_EXPIRY_MARGIN", DEFAULT_EXPIRY_MARGIN)
+            ),
+        )
+        self.credential_cache = CredentialCache(
+            maxsize=int(config.get("AZURE_CREDENTIAL_CACHE_SIZE", DEFAULT_MAXSIZE)),
+            ttl=int(config.get("AZURE_CREDENTIAL_CACHE_TTL", DEFAULT_TTL)),
+        )
+        self.poll_by_reschedule = config.get(
+            "AZURE_MGMT_GROUP_POLL_BY_RESCHEDULE", False
+        )
+
     @log_and_raise_exceptions
     def _get_keyvault_token(self):
         url = urljoin(
@@ -263,6 +295,7 @@ class AzureCloudProvider(CloudProviderInterface):
             payload.display_name,
             payload.tenant_id,
             payload.parent_id,
+            wait=not self.poll_by_reschedule,
         )
 
         return EnvironmentCSPResult(**response)
@@ -274,6 +307,7 @@ class AzureCloudProvider(CloudProviderInterface):
             payload.display_name,
             payload.tenant_id,
             payload.parent_id,
+            wait=not self.poll_by_reschedule,
         )
 
         return ApplicationCSPResult(**response)
@@ -292,9 +326,16 @@ class AzureCloudProvider(CloudProviderInterface):
         can be nested.
 
         https://docs.microsoft.com/en-us/azure/governance/management-groups/overview
+
+        If `AZURE_MGMT_GROUP_POLL_BY_RESCHEDULE` is set, this returns as soon as
+        Azure accepts the request, and the verification stage waits for the
+        creation to finish.
         """
         response = self._create_management_group(
-            payload.management_group_name, payload.display_name, payload.tenant_id,
+            payload.management_group_name,
+            payload.display_name,
+            payload.tenant_id,
+            wait=not self.poll_by_reschedule,
         )
 
         return InitialMgmtGroupCSPResult(**response)
@@ -312,6 +353,24 @@ class AzureCloudProvider(CloudProviderInterface):
         https://docs.microsoft.com/en-us/azure/governance/management-groups/overview
         """
 
+        if payload.management_group_status_url:
+            session = self.sdk.requests.Session()
+            session.headers = make_auth_header(
+                self._get_tenant_principal_token(payload.tenant_id)
+            )
+            result, _ = self._check_management_group_creation_job(
+                payload.management_group_status_url,
+                payload.management_group_result_url,
+                session,
+            )
+            if result is None:
+                return InitialMgmtGroupCSPResult(
+                    name=payload.management_group_name,
+                    status_url=payload.management_group_status_url,
+                    result_url=payload.management_group_result_url,
+                    reset_stage=True,
+                )
+
         with self._get_elevated_access_token(
             payload.tenant_id, payload.user_object_id
         ) as elevated_token:
@@ -329,7 +388,7 @@ class AzureCloudProvider(CloudProviderInterface):
 
     @log_and_raise_exceptions
     def _create_management_group(
-        self, management_group_id, display_name, tenant_id, parent_id=None,
+        self, management_group_id, display_name, tenant_id, parent_id=None, wait=True
     ):
         """
         Create a new Azure management group.
@@ -340,10 +399,17 @@ class AzureCloudProvider(CloudProviderInterface):
             display_name: a display name for the management group
             tenant_id: the ID for the Azure Active Directory tenant to create the management group in
             parent_id: (optional) the ID of the parent for the management group
+            wait: (optional) if False, do not wait for Azure to finish creating
+                the management group. The URLs to check the creation with are
+                returned instead, and the parent is applied by
+                `get_management_group_creation_status`.
         Returns:
             ManagementGroup: https://docs.microsoft.com/en-us/rest/api/resources/managementgroups/createorupdate#managementgroup
             or
             AzureAsyncOperationResults: https://docs.microsoft.com/en-us/rest/api/resources/managementgroups/createorupdate#azureasyncoperationresults
+            or, if the creation is still in progress and `wait` is False, a
+            dictionary of the management group's id and name, plus the
+            status_url, result_url and retry_after of the creation job
         """
         sp_token = self._get_tenant_principal_token(tenant_id)
         session = self.sdk.requests.Session()
@@ -364,6 +430,14 @@ class AzureCloudProvider(CloudProviderInterface):
         if response.status_code == 202:
             status_url = response.headers["Azure-AsyncOperation"]
             result_url = response.headers["Location"]
+            if not wait:
+                return {
+                    "id": f"/providers/Microsoft.Management/managementGroups/{management_group_id}",
+                    "name": management_group_id,
+                    "status_url": status_url,
+                    "result_url": result_url,
+                    "retry_after": int(response.headers.get("Retry-After", 10)),
+                }
             resp = self._poll_management_group_creation_job(
                 status_url, result_url, session
             )
@@ -404,11 +478,50 @@ class AzureCloudProvider(CloudProviderInterface):
         return True
 
     @log_and_raise_exceptions
-    def _poll_management_group_creation_job(
+    def get_management_group_creation_status(
+        self, payload: ManagementGroupCreationStatusCSPPayload
+    ) -> ManagementGroupCSPResponse:
+        """Check once on a management group creation that
+        `_create_management_group` did not wait for.
+
+        If the creation succeeded, the parent of the management group is
+        applied and the management group is returned. Otherwise the returned
+        response is still pending, and gives the number of seconds to wait
+        before checking again.
+
+        Raises:
+            ResourceProvisioningError: Azure failed to create the management
+                group
+        """
+        session = self.sdk.requests.Session()
+        session.headers = make_auth_header(
+            self._get_tenant_principal_token(payload.tenant_id)
+        )
+        result, retry_after = self._check_management_group_creation_job(
+            payload.status_url, payload.result_url, session
+        )
+        if result is None:
+            return ManagementGroupCSPResponse(
+                id=f"/providers/Microsoft.Management/managementGroups/{payload.management_group_name}",
+                name=payload.management_group_name,
+                status_url=payload.status_url,
+                result_url=payload.result_url,
+                retry_after=retry_after,
+            )
+
+        if payload.parent_id:
+            # See `_create_management_group`
+            self._force_apply_mgmt_grp_parent(
+                session, payload.parent_id, payload.management_group_name
+            )
+
+        return ManagementGroupCSPResponse(**result)
+
+    @log_and_raise_exceptions
+    def _check_management_group_creation_job(
         self, status_url: str, result_url: str, session
-    ) -> Dict:
-        """Polls the management group creation job until it is resolved and
-        returns the result.
+    ) -> Tuple[Optional[Dict], int]:
+        """Checks the status of a management group creation job once.
 
         https://docs.microsoft.com/en-us/azure/azure-resource-manager/management/async-operations
 
@@ -422,7 +535,9 @@ class AzureCloudProvider(CloudProviderInterface):
             session: a requests session populated with a service principal
                 bearer token.
         Returns:
-            A dictionary of details of the created management group
+            A tuple of a dictionary of details of the created management
+            group, or None if the job is still in progress, and the number of
+            seconds to wait before checking the job again
 
         Raises:
             ResourceProvisioningError: Something went wrong when trying to
@@ -430,23 +545,42 @@ class AzureCloudProvider(CloudProviderInterface):
             RequestException: Something went wrong when trying to make the request
         """
 
+        response = session.get(status_url)
+        response.raise_for_status()
+        response_json = response.json()
+        status = response_json["status"]
+        if status == AsyncOperationStatus.SUCCEEDED.value:
+            resp = session.get(result_url)
+            resp.raise_for_status()
+            return resp.json(), 0
+        elif status in (
+            AsyncOperationStatus.FAILED.value,
+            AsyncOperationStatus.CANCELED.value,
+        ):
+            error_message = f"{response_json['error']['message']}\nError code: {response_json['error']['code']}"
+            raise ResourceProvisioningError("management group", f"{error_message}")
+        else:
+            return None, int(response.headers.get("Retry-After", 10))
+
+    @log_and_raise_exceptions
+    def _poll_management_group_creation_job(
+        self, status_url: str, result_url: str, session
+    ) -> Dict:
+        """Polls the management group creation job until it is resolved and
+        returns the result. See `_check_management_group_creation_job`.
+
+        This blocks the worker until Azure finishes creating the management
+        group. Set `AZURE_MGMT_GROUP_POLL_BY_RESCHEDULE` to check on the job
+        from a later task instead.
+        """
+
         while True:
-            response = session.get(status_url)
-            response.raise_for_status()
-            response_json = response.json()
-            status = response_json["status"]
-            if status == AsyncOperationStatus.SUCCEEDED.value:
-                resp = session.get(result_url)
-                resp.raise_for_status()
-                return resp.json()
-            elif status in (
-                AsyncOperationStatus.FAILED.value,
-                AsyncOperationStatus.CANCELED.value,
-            ):
-                error_message = f"{response_json['error']['message']}\nError code: {response_json['error']['code']}"
-                raise ResourceProvisioningError("management group", f"{error_message}")
-            else:
-                time.sleep(int(response.headers.get("Retry-After", 10)))
+            result, retry_after = self._check_management_group_creation_job(
+                status_url, result_url, session
+            )
+            if result is not None:
+                return result
+            time.sleep(retry_after)
 
     @log_and_raise_exceptions
     def _create_policy_definition(self, session, root_management_group_name, policy):
@@ -1428,7 +1562,9 @@ class AzureCloudProvider(CloudProviderInterface):
 
     @log_and_raise_exceptions
     def _create_active_directory_user(self, graph_token, payload) -> UserCSPResult:
-        result = create_active_directory_user(graph_token, self.graph_resource, payload)
+        result = create_active_directory_user(
+            graph_token, self.graph_resource, payload, session=self.sdk.requests
+        )
         result.raise_for_status()
 
         return UserCSPResult(**result.json())
@@ -1498,13 +1634,14 @@ class AzureCloudProvider(CloudProviderInterface):
                 f"Failed to create user role assignment: {response.json()}"
             )
 
-    def _get_tenant_admin_token(self, tenant_id, scope):
+    def _get_tenant_admin_token(self, tenant_id, scope, use_cache=True):
         creds = self._source_tenant_creds(tenant_id)
         return self._get_user_principal_token_for_scope(
             creds.tenant_admin_username,
             creds.tenant_admin_password,
             creds.tenant_id,
             scope,
+            use_cache=use_cache,
         )
 
     def _get_root_provisioning_token(self):
@@ -1521,7 +1658,9 @@ class AzureCloudProvider(CloudProviderInterface):
         payload = ServicePrincipalTokenPayload(
             scope=payload_scope, client_id=client_id, client_secret=secret_key,
         )
-        token = get_principal_auth_token(tenant_id, payload)
+        token = get_principal_auth_token(
+            tenant_id, payload, token_cache=self.token_cache, session=self.sdk.requests
+        )
         if token is None:
             message = f"Failed to get service principal token for scope '{payload_scope}' in tenant '{tenant_id}'"
             app.logger.error(message, exc_info=1)
@@ -1530,14 +1669,21 @@ class AzureCloudProvider(CloudProviderInterface):
             return token
 
     @log_and_raise_exceptions
-    def _get_user_principal_token_for_scope(self, username, password, tenant_id, scope):
+    def _get_user_principal_token_for_scope(
+        self, username, password, tenant_id, scope, use_cache=True
+    ):
         payload = UserPrincipalTokenPayload(
             client_id=self.powershell_client_id,
             username=username,
             password=password,
             scope=scope,
         )
-        token = get_principal_auth_token(tenant_id, payload)
+        token = get_principal_auth_token(
+            tenant_id,
+            payload,
+            token_cache=self.token_cache if use_cache else None,
+            session=self.sdk.requests,
+        )
         if token is None:
             message = f"Failed to get user principal token for scope '{scope}' in tenant '{tenant_id}'"
             app.logger.error(message, exc_info=1)
@@ -1588,22 +1734,35 @@ class AzureCloudProvider(CloudProviderInterface):
         self, tenant_id, secret: KeyVaultCredentials
     ) -> KeyVaultCredentials:
         hashed = sha256_hex(tenant_id)
+        self.credential_cache.invalidate(tenant_id)
         self.set_secret(hashed, json.dumps(secret.dict()))
+        self.credential_cache.set(tenant_id, secret)
         return secret
 
     def update_tenant_creds(
         self, tenant_id, secret: KeyVaultCredentials
     ) -> KeyVaultCredentials:
         hashed = sha256_hex(tenant_id)
-        curr_secrets = self._source_tenant_creds(tenant_id)
+        # Read the current secret from KeyVault so that changes made by other
+        # processes are not overwritten with a stale cached copy.
+        curr_secrets = self._source_tenant_creds(tenant_id, use_cache=False)
         updated_secrets = curr_secrets.merge_credentials(secret)
+        self.credential_cache.invalidate(tenant_id)
         self.set_secret(hashed, json.dumps(updated_secrets.dict()))
+        self.credential_cache.set(tenant_id, updated_secrets)
         return updated_secrets
 
-    def _source_tenant_creds(self, tenant_id) -> KeyVaultCredentials:
+    def _source_tenant_creds(self, tenant_id, use_cache=True) -> KeyVaultCredentials:
+        if use_cache:
+            creds = self.credential_cache.get(tenant_id)
+            if creds is not None:
+                return creds
+
         hashed = sha256_hex(tenant_id)
         raw_creds = self.get_secret(hashed)
-        return KeyVaultCredentials(**json.loads(raw_creds))
+        creds = KeyVaultCredentials(**json.loads(raw_creds))
+        self.credential_cache.set(tenant_id, creds)
+        return creds
 
     @log_and_raise_exceptions
     def get_reporting_data(self, payload: CostManagementQueryCSPPayload, token=None):
@@ -1778,8 +1937,12 @@ class AzureCloudProvider(CloudProviderInterface):
         )
         elevated_token = None
         try:
+            # A token issued before elevation does not carry the elevated
+            # access, so always request a fresh one here.
             elevated_token = self._get_tenant_admin_token(
-                tenant_id, self.sdk.cloud.endpoints.resource_manager + "/.default"
+                tenant_id,
+                self.sdk.cloud.endpoints.resource_manager + "/.default",
+                use_cache=False,
             )
             yield elevated_token
         finally:
@@ -88,3 +88,13 @@ class CloudProviderInterface:  # pragma: no cover
 
     def create_application(self, payload):
         raise NotImplementedError()
+
+    def get_management_group_creation_status(self, payload):
+        """Check on the creation of an application or environment management
+        group that was still in progress when it was created.
+
+        Returns:
+            ManagementGroupCSPResponse: still pending if the creation is in
+            progress
+        """
+        raise NotImplementedError()
@@ -0,0 +1,51 @@
+import threading
+
+from cachetools import TTLCache
+
+DEFAULT_MAXSIZE = 256
+DEFAULT_TTL = 900
+
+
+class CredentialCache(object):
+    """In-process cache of tenant KeyVault credentials.
+
+    Entries expire after `ttl` seconds, and the least recently used entry is
+    evicted once `maxsize` tenants are cached. Callers are expected to write
+    through to the cache whenever they store new credentials in KeyVault.
+
+    `hits` and `misses` count lookups so the effectiveness of the cache can be
+    monitored.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tenant_id):
+        with self._lock:
+            creds = self._cache.get(tenant_id)
+            if creds is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return creds.copy()
+
+    def set(self, tenant_id, creds):
+        with self._lock:
+            self._cache[tenant_id] = creds.copy()
+
+    def invalidate(self, tenant_id):
+        with self._lock:
+            self._cache.pop(tenant_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
@@ -230,6 +230,11 @@ class HybridCloudProvider(object):
         payload.display_name = f"{HYBRID_PREFIX} {payload.display_name}"
         return self.azure.create_environment(payload)
 
+    def get_management_group_creation_status(
+        self, payload: ManagementGroupCreationStatusCSPPayload
+    ) -> ManagementGroupCSPResponse:
+        return self.azure.get_management_group_creation_status(payload)
+
     def create_user(self, payload: UserCSPPayload) -> UserCSPResult:
         return self.azure.create_user(payload)
 
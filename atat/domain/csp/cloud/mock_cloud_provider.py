@@ -35,6 +35,8 @@ from .models import (
     InitialMgmtGroupCSPResult,
     InitialMgmtGroupVerificationCSPPayload,
     InitialMgmtGroupVerificationCSPResult,
+    ManagementGroupCreationStatusCSPPayload,
+    ManagementGroupCSPResponse,
     PoliciesCSPPayload,
     PoliciesCSPResult,
     PrincipalAdminRoleCSPPayload,
@@ -482,6 +484,16 @@ class MockCloudProvider(CloudProviderInterface):
             name=payload.management_group_name,
         )
 
+    def get_management_group_creation_status(
+        self, payload: ManagementGroupCreationStatusCSPPayload
+    ):
+        self._maybe_raise(self.UNAUTHORIZED_RATE, GeneralCSPException)
+
+        return ManagementGroupCSPResponse(
+            id=f"{AZURE_MGMNT_PATH}{payload.management_group_name}",
+            name=payload.management_group_name,
+        )
+
     def create_user(self, payload: UserCSPPayload):
         self._maybe_raise(self.UNAUTHORIZED_RATE, GeneralCSPException)
 
@@ -445,8 +445,43 @@ class ManagementGroupCSPPayload(BaseCSPPayload):
 
 
 class ManagementGroupCSPResponse(AliasModel):
+    """
+    :param: status_url, result_url: Set when Azure accepted the creation
+        request but has not finished creating the management group. Check
+        the creation with `get_management_group_creation_status`.
+    :param: retry_after: The number of seconds Azure asks us to wait before
+        checking the creation status again.
+    """
+
     id: str
     name: str
+    status_url: Optional[str]
+    result_url: Optional[str]
+    retry_after: Optional[int]
+
+    @property
+    def is_pending(self):
+        return self.status_url is not None
+
+
+class ManagementGroupCreationStatusCSPPayload(BaseCSPPayload):
+    """
+    :param: management_group_name: The name of the management group being
+        created.
+    :param: parent_id: The fully qualified ID of the parent management group,
+        if any. It is applied once the creation succeeds.
+    :param: status_url, result_url: The URLs returned in the
+        Azure-AsyncOperation and Location headers of the creation response.
+    """
+
+    management_group_name: str
+    parent_id: Optional[str]
+    status_url: str
+    result_url: str
+
+    _normalize_parent_id = validator("parent_id", allow_reuse=True)(
+        normalize_management_group_id
+    )
 
 
 class ManagementGroupGetCSPPayload(BaseCSPPayload):
@@ -474,10 +509,14 @@ class InitialMgmtGroupCSPPayload(ManagementGroupCSPPayload):
 
 class InitialMgmtGroupCSPResult(AliasModel):
     initial_management_group_name: str
+    initial_management_group_status_url: Optional[str]
+    initial_management_group_result_url: Optional[str]
 
     class Config:
         fields = {
             "initial_management_group_name": "name",
+            "initial_management_group_status_url": "status_url",
+            "initial_management_group_result_url": "result_url",
         }
 
     @property
@@ -487,9 +526,15 @@ class InitialMgmtGroupCSPResult(AliasModel):
 
 class InitialMgmtGroupVerificationCSPPayload(ManagementGroupGetCSPPayload):
     user_object_id: str
+    management_group_status_url: Optional[str]
+    management_group_result_url: Optional[str]
 
     class Config:
-        fields = {"management_group_name": "initial_management_group_name"}
+        fields = {
+            "management_group_name": "initial_management_group_name",
+            "management_group_status_url": "initial_management_group_status_url",
+            "management_group_result_url": "initial_management_group_result_url",
+        }
 
 
 class InitialMgmtGroupVerificationCSPResult(ManagementGroupGetCSPResponse):
@@ -782,6 +827,7 @@ __all__ = [
     "KeyVaultCredentials",
     "ManagementGroupCSPPayload",
     "ManagementGroupCSPResponse",
+    "ManagementGroupCreationStatusCSPPayload",
     "ManagementGroupGetCSPPayload",
     "ManagementGroupGetCSPResponse",
     "PoliciesCSPPayload",
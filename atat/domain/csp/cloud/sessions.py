@@ -0,0 +1,134 @@
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_TIMEOUT = 30
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class PooledRequests(object):
+    """A stand-in for the `requests` module that sends every request through a
+    long-lived `requests.Session` for the target host.
+
+    Reusing one session per host keeps TCP and TLS connections alive between
+    calls to management.azure.com, graph.microsoft.com,
+    login.microsoftonline.com, etc. Each session is mounted with an adapter
+    that has a bounded connection pool and retries connection errors and
+    throttling / transient server errors. Only idempotent methods are retried
+    after a request has been sent, and the `Retry-After` header is respected.
+
+    Once retries are exhausted the last response is returned, so callers
+    handle errors with `raise_for_status` exactly as they would with
+    `requests`.
+    """
+
+    exceptions = requests.exceptions
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        max_retries=DEFAULT_MAX_RETRIES,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _make_adapter(self):
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+
+    def session_for(self, url):
+        """Return the pooled session for the scheme and host of `url`."""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(origin)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(origin)
+                if session is None:
+                    session = requests.Session()
+                    session.mount(f"{origin}/", self._make_adapter())
+                    self._sessions[origin] = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def Session(self):
+        """Return a session-like object with its own default headers that
+        sends requests through the pooled sessions."""
+        return PooledSession(self)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class PooledSession(object):
+    """Holds default headers for a series of requests, like
+    `requests.Session`, without owning a connection pool of its own."""
+
+    def __init__(self, pooled_requests):
+        self._requests = pooled_requests
+        self.headers = {}
+
+    def request(self, method, url, headers=None, **kwargs):
+        merged_headers = {**self.headers, **(headers or {})}
+        return self._requests.request(method, url, headers=merged_headers, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
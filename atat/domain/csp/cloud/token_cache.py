@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+
+from atat.utils import sha256_hex
+
+DEFAULT_EXPIRY_MARGIN = 300
+DEFAULT_KEY_PREFIX = "csp-token"
+
+
+class TokenCache(object):
+    """Caches OAuth access tokens until shortly before they expire.
+
+    Tokens are keyed by tenant, client, scope and (for user principals)
+    username. An entry is treated as expired `expiry_margin` seconds before
+    the `expires_in` reported by AAD, so callers always refresh a token
+    before Azure would reject it.
+
+    Entries are held in process memory so they are shared by every task run
+    by a Celery worker process. If a redis client is provided, tokens are also
+    written through to redis so they can be shared across processes.
+    """
+
+    def __init__(
+        self,
+        redis=None,
+        expiry_margin=DEFAULT_EXPIRY_MARGIN,
+        key_prefix=DEFAULT_KEY_PREFIX,
+        clock=time.time,
+    ):
+        self.redis = redis
+        self.expiry_margin = expiry_margin
+        self.key_prefix = key_prefix
+        self._clock = clock
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tenant_id, payload):
+        """Build a cache key for a token request payload.
+
+        args:
+            tenant_id (str)
+            payload (UserPrincipalTokenPayload or ServicePrincipalTokenPayload)
+        returns:
+            str: key
+        """
+        username = getattr(payload, "username", "")
+        return sha256_hex(
+            ":".join([tenant_id, payload.client_id, payload.scope, username])
+        )
+
+    def get(self, key):
+        now = self._clock()
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is not None:
+                token, expires_at = entry
+                if expires_at > now:
+                    return token
+                del self._tokens[key]
+
+        if self.redis is None:
+            return None
+
+        raw_entry = self.redis.get(self._redis_key(key))
+        if raw_entry is None:
+            return None
+
+        entry = json.loads(raw_entry)
+        if entry["expires_at"] <= now:
+            return None
+
+        with self._lock:
+            self._tokens[key] = (entry["token"], entry["expires_at"])
+        return entry["token"]
+
+    def set(self, key, token, expires_in):
+        """Store a token that AAD reported as valid for `expires_in` seconds.
+
+        Tokens with a lifetime shorter than the expiry margin are not cached.
+        """
+        try:
+            ttl = int(expires_in) - self.expiry_margin
+        except (TypeError, ValueError):
+            return
+        if ttl <= 0:
+            return
+
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._tokens[key] = (token, expires_at)
+
+        if self.redis is not None:
+            self.redis.setex(
+                name=self._redis_key(key),
+                value=json.dumps({"token": token, "expires_at": expires_at}),
+                time=ttl,
+            )
+
+    def invalidate(self, key):
+        with self._lock:
+            self._tokens.pop(key, None)
+        if self.redis is not None:
+            self.redis.delete(self._redis_key(key))
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+    def _redis_key(self, key):
+        return f"{self.key_prefix}:{key}"
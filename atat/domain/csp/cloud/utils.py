@@ -25,27 +25,45 @@ def generate_mail_nickname(name):
     return re.sub(f"[{ESCAPED_PUNCTUATION} ]+", ".", name).lower()
 
 
-def get_principal_auth_token(tenant_id, payload):
+def get_principal_auth_token(tenant_id, payload, token_cache=None, session=None):
     """Returns an OAuth Access token for a User or Service Principal
 
+    If a token cache is provided, a cached token is returned when one is
+    still valid, and newly issued tokens are stored using the `expires_in`
+    value from the token response.
+
     args:
         tenant_id (str)
         payload (UserPrincipalTokenPayload or ServicePrincipalTokenPayload)
+        token_cache (TokenCache, optional)
+        session (PooledRequests, optional): used in place of `requests`
     returns:
         str: token
         or
         None
     """
 
+    if token_cache is not None:
+        cache_key = token_cache.key(tenant_id, payload)
+        token = token_cache.get(cache_key)
+        if token is not None:
+            return token
+
     url = f"{cloud.endpoints.active_directory}/{tenant_id}/oauth2/v2.0/token"
-    response = requests.post(url, data=payload.dict(), timeout=30)
+    session = session or requests
+    response = session.post(url, data=payload.dict(), timeout=30)
     response.raise_for_status()
-    token = response.json().get("access_token")
+    response_json = response.json()
+    token = response_json.get("access_token")
+
+    if token is not None and token_cache is not None:
+        token_cache.set(cache_key, token, response_json.get("expires_in"))
+
     return token
 
 
 def create_active_directory_user(
-    graph_token, graph_resource, payload, password_reset=True
+    graph_token, graph_resource, payload, password_reset=True, session=None
 ):
     request_body = {
         "accountEnabled": True,
@@ -61,7 +79,8 @@ def create_active_directory_user(
     }
 
     url = f"{graph_resource}/v1.0/users"
+    session = session or requests
 
-    return requests.post(
+    return session.post(
         url, headers=make_auth_header(graph_token), json=request_body, timeout=30,
     )
@@ -15,6 +15,7 @@ from atat.domain.csp.cloud.models import (
     ApplicationCSPPayload,
     BillingInstructionCSPPayload,
     EnvironmentCSPPayload,
+    ManagementGroupCreationStatusCSPPayload,
     SubscriptionCreationCSPPayload,
     UserCSPPayload,
     UserRoleCSPPayload,
@@ -26,10 +27,20 @@ from atat.domain.portfolios import Portfolios
 from atat.domain.task_orders import TaskOrders
 from atat.models import CSPRole, JobFailure
 from atat.models.mixins.state_machines import PortfolioStates
-from atat.models.utils import claim_for_update, claim_many_for_update
+from atat.models.utils import (
+    claim_for_update,
+    claim_many_for_update,
+    hold_claim,
+    release_claim,
+)
 from atat.queue import celery
 from atat.utils.localization import translate
 
+# Number of seconds past Azure's Retry-After to keep a resource claimed while
+# its management group is being created, in case the task that checks on the
+# creation is delayed.
+MGMT_GROUP_CHECK_CLAIM_MARGIN = 300
+
 
 class RecordFailure(celery.Task):
     _ENTITIES = [
@@ -97,11 +108,86 @@ def do_create_application(csp: CloudProviderInterface, application_id=None):
         )
 
         app_result = csp.create_application(payload)
-        application.cloud_id = (
-            f"/providers/Microsoft.Management/managementGroups/{app_result.name}"
+        if app_result.is_pending:
+            defer_management_group_check(
+                check_application_creation,
+                application,
+                app_result,
+                parent_id,
+                application_id=application.id,
+            )
+            return
+
+        finish_application_creation(application, app_result)
+
+
+def finish_application_creation(application, app_result):
+    application.cloud_id = (
+        f"/providers/Microsoft.Management/managementGroups/{app_result.name}"
+    )
+    db.session.add(application)
+    db.session.commit()
+
+
+def defer_management_group_check(task, resource, result, parent_id, **kwargs):
+    """Keep a resource claimed while Azure creates its management group, and
+    schedule `task` to check on the creation after Azure's Retry-After.
+
+    This way the worker doesn't wait on Azure, and the dispatcher doesn't try
+    to create the resource again in the meantime.
+    """
+    hold_claim(resource, result.retry_after + MGMT_GROUP_CHECK_CLAIM_MARGIN)
+    async_result = task.apply_async(
+        kwargs=dict(
+            management_group_name=result.name,
+            parent_id=parent_id,
+            status_url=result.status_url,
+            result_url=result.result_url,
+            **kwargs,
+        ),
+        countdown=result.retry_after,
+    )
+    app.logger.info(
+        "Management group %s is being created. Checking again in %s seconds [Task ID: %s]",
+        result.name,
+        result.retry_after,
+        async_result.task_id,
+    )
+
+
+def build_management_group_creation_status_payload(
+    tenant_id, management_group_name, parent_id, status_url, result_url
+):
+    return ManagementGroupCreationStatusCSPPayload(
+        tenant_id=tenant_id,
+        management_group_name=management_group_name,
+        parent_id=parent_id,
+        status_url=status_url,
+        result_url=result_url,
+    )
+
+
+def do_check_application_creation(
+    csp: CloudProviderInterface, application_id=None, parent_id=None, **creation
+):
+    application = Applications.get(application_id)
+    payload = build_management_group_creation_status_payload(
+        application.portfolio.csp_data["tenant_id"], parent_id=parent_id, **creation
+    )
+
+    app_result = csp.get_management_group_creation_status(payload)
+    if app_result.is_pending:
+        defer_management_group_check(
+            check_application_creation,
+            application,
+            app_result,
+            parent_id,
+            application_id=application.id,
         )
-        db.session.add(application)
-        db.session.commit()
+        return
+
+    finish_application_creation(application, app_result)
+    release_claim(application)
 
 
 def do_create_user(csp: CloudProviderInterface, application_role_ids=None):
@@ -185,15 +271,52 @@ def do_create_environment(csp: CloudProviderInterface, environment_id=None):
             tenant_id=tenant_id, display_name=environment.name, parent_id=parent_id
         )
         env_result = csp.create_environment(payload)
-        Environments.update(environment, new_data={"cloud_id": env_result.id})
+        if env_result.is_pending:
+            defer_management_group_check(
+                check_environment_creation,
+                environment,
+                env_result,
+                parent_id,
+                environment_id=environment.id,
+            )
+            return
 
-        app.logger.info("Created environment %s", env_result.name)
-        async_result = create_subscription.delay(environment_id=environment.id)
-        app.logger.info(
-            "Attempting to create subscription for environment %s [Task ID: %s])",
-            env_result.name,
-            async_result.task_id,
+        finish_environment_creation(environment, env_result)
+
+
+def finish_environment_creation(environment, env_result):
+    Environments.update(environment, new_data={"cloud_id": env_result.id})
+
+    app.logger.info("Created environment %s", env_result.name)
+    async_result = create_subscription.delay(environment_id=environment.id)
+    app.logger.info(
+        "Attempting to create subscription for environment %s [Task ID: %s])",
+        env_result.name,
+        async_result.task_id,
+    )
+
+
+def do_check_environment_creation(
+    csp: CloudProviderInterface, environment_id=None, parent_id=None, **creation
+):
+    environment = Environments.get(environment_id)
+    payload = build_management_group_creation_status_payload(
+        environment.portfolio.csp_data["tenant_id"], parent_id=parent_id, **creation
+    )
+
+    env_result = csp.get_management_group_creation_status(payload)
+    if env_result.is_pending:
+        defer_management_group_check(
+            check_environment_creation,
+            environment,
+            env_result,
+            parent_id,
+            environment_id=environment.id,
         )
+        return
+
+    finish_environment_creation(environment, env_result)
+    release_claim(environment)
 
 
 @celery.task(bind=True, base=RecordFailure, autoretry_for=(GeneralCSPException,))
@@ -345,6 +468,14 @@ def create_application(self: Task, application_id=None):
     return application_id
 
 
+@celery.task(bind=True, base=RecordFailure, autoretry_for=(GeneralCSPException,))
+def check_application_creation(self: Task, application_id=None, **creation):
+    do_check_application_creation(
+        app.csp.cloud, application_id=application_id, **creation
+    )
+    return application_id
+
+
 @celery.task(bind=True, base=RecordFailure, autoretry_for=(GeneralCSPException,))
 def create_user(self: Task, application_role_ids=None):
     do_create_user(app.csp.cloud, application_role_ids=application_role_ids)
@@ -363,6 +494,14 @@ def create_environment(self: Task, environment_id=None):
     return environment_id
 
 
+@celery.task(bind=True, base=RecordFailure, autoretry_for=(GeneralCSPException,))
+def check_environment_creation(self: Task, environment_id=None, **creation):
+    do_check_environment_creation(
+        app.csp.cloud, environment_id=environment_id, **creation
+    )
+    return environment_id
+
+
 @celery.task(bind=True)
 def dispatch_provision_portfolio(self: Task):
     """
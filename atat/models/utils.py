@@ -40,18 +40,56 @@ def claim_for_update(resource, minutes=30):
 
     # Fetch the claimed resource
     claimed = db.session.query(Model).filter_by(id=resource.id).one()
+    claimed_until = claimed.claimed_until
 
     try:
         # Give the resource to the caller.
         yield claimed
     finally:
-        # Release the claim.
+        # Release the claim, unless the caller extended it with `hold_claim`.
         db.session.query(Model).filter(Model.id == resource.id).filter(
-            Model.claimed_until != None
+            Model.claimed_until == claimed_until
         ).update({"claimed_until": None}, synchronize_session="fetch")
         db.session.commit()
 
 
+def hold_claim(resource, seconds):
+    """
+    Keep a resource claimed for `seconds` from now. Inside a
+    `claim_for_update` block, this keeps the claim from being released at
+    the end of the block, e.g. while an asynchronous CSP operation started
+    under the claim is still in progress.
+
+    Args:
+        resource:   A SQLAlchemy model instance with a `claimed_until` attribute.
+        seconds:    The amount of time, in seconds, to hold the claim.
+    """
+    Model = resource.__class__
+
+    hold_until = func.now() + func.cast(
+        sql.functions.concat(seconds, " SECONDS"), Interval
+    )
+    db.session.query(Model).filter(Model.id == resource.id).update(
+        {"claimed_until": hold_until}, synchronize_session="fetch"
+    )
+    db.session.commit()
+
+
+def release_claim(resource):
+    """
+    Release a claim kept with `hold_claim`.
+
+    Args:
+        resource:   A SQLAlchemy model instance with a `claimed_until` attribute.
+    """
+    Model = resource.__class__
+
+    db.session.query(Model).filter(Model.id == resource.id).update(
+        {"claimed_until": None}, synchronize_session="fetch"
+    )
+    db.session.commit()
+
+
 @contextmanager
 def claim_many_for_update(resources: List, minutes=30):
     """
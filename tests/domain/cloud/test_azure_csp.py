@@ -1434,6 +1434,61 @@ def test_update_tenant_creds(mock_azure: AzureCloudProvider, monkeypatch):
     assert updated_secret == KeyVaultCredentials(**{**existing_secrets, **new_secrets})
 
 
+class TestTenantCredentialCache:
+    def test_caches_sourced_creds(self, mock_azure: AzureCloudProvider):
+        first = mock_azure._source_tenant_creds("mock_tenant_id")
+        second = mock_azure._source_tenant_creds("mock_tenant_id")
+
+        assert first == second
+        assert mock_azure.get_secret.call_count == 1
+        assert mock_azure.credential_cache.hits == 1
+        assert mock_azure.credential_cache.misses == 1
+
+    def test_create_tenant_creds_writes_through(self, mock_azure: AzureCloudProvider):
+        creds = KeyVaultCredentials(
+            tenant_id="new_tenant",
+            tenant_sp_client_id="client",
+            tenant_sp_key="key",  # pragma: allowlist secret
+        )
+        mock_azure.create_tenant_creds("new_tenant", creds)
+
+        assert mock_azure._source_tenant_creds("new_tenant") == creds
+        mock_azure.get_secret.assert_not_called()
+
+    def test_update_tenant_creds_reads_through_and_writes_through(
+        self, mock_azure: AzureCloudProvider
+    ):
+        mock_azure._source_tenant_creds("mock_tenant_id")
+        updated = mock_azure.update_tenant_creds(
+            "mock_tenant_id",
+            KeyVaultCredentials(
+                tenant_id="mock_tenant_id",
+                tenant_sp_client_id="new_client",
+                tenant_sp_key="new_key",  # pragma: allowlist secret
+            ),
+        )
+
+        assert mock_azure.get_secret.call_count == 2
+        assert mock_azure._source_tenant_creds("mock_tenant_id") == updated
+        assert mock_azure.get_secret.call_count == 2
+
+    def test_failed_write_invalidates(self, mock_azure: AzureCloudProvider):
+        mock_azure._source_tenant_creds("mock_tenant_id")
+        mock_azure.set_secret.side_effect = ConnectionException("uh oh")
+        with pytest.raises(ConnectionException):
+            mock_azure.update_tenant_creds(
+                "mock_tenant_id",
+                KeyVaultCredentials(
+                    tenant_id="mock_tenant_id",
+                    tenant_sp_client_id="new_client",
+                    tenant_sp_key="new_key",  # pragma: allowlist secret
+                ),
+            )
+
+        mock_azure._source_tenant_creds("mock_tenant_id")
+        assert mock_azure.get_secret.call_count == 3
+
+
 def test_get_calculator_url(mock_azure: AzureCloudProvider):
     mock_result = mock_requests_response(
         status=200, json_data={"access_token": MOCK_ACCESS_TOKEN},
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+
+from atat.domain.csp.cloud.sessions import PooledRequests
+
+
+@pytest.fixture
+def pooled_requests():
+    pooled = PooledRequests(pool_maxsize=4, max_retries=2)
+    yield pooled
+    pooled.close()
+
+
+def test_reuses_session_per_host(pooled_requests):
+    management = pooled_requests.session_for("https://management.azure.com/a")
+    graph = pooled_requests.session_for("https://graph.microsoft.com/v1.0/users")
+
+    assert management is pooled_requests.session_for("https://management.azure.com/b")
+    assert management is not graph
+
+
+def test_mounts_adapter_with_pool_and_retries(pooled_requests):
+    session = pooled_requests.session_for("https://graph.microsoft.com/v1.0/users")
+    adapter = session.get_adapter("https://graph.microsoft.com/v1.0/users")
+
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_request_applies_default_timeout(pooled_requests, monkeypatch):
+    session = pooled_requests.session_for("https://graph.microsoft.com")
+    monkeypatch.setattr(session, "request", Mock())
+
+    pooled_requests.get("https://graph.microsoft.com/v1.0/users")
+    pooled_requests.post("https://graph.microsoft.com/v1.0/users", timeout=5)
+
+    assert session.request.call_args_list[0][1]["timeout"] == 30
+    assert session.request.call_args_list[1][1]["timeout"] == 5
+
+
+def test_session_merges_default_headers(pooled_requests, monkeypatch):
+    session = pooled_requests.session_for("https://management.azure.com")
+    monkeypatch.setattr(session, "request", Mock())
+
+    pooled_session = pooled_requests.Session()
+    pooled_session.headers.update({"Authorization": "Bearer token"})
+    pooled_session.put(
+        "https://management.azure.com/group", headers={"Accept": "application/json"}
+    )
+
+    assert session.request.call_args[1]["headers"] == {
+        "Authorization": "Bearer token",
+        "Accept": "application/json",
+    }
@@ -0,0 +1,78 @@
+from unittest.mock import Mock
+
+from atat.domain.csp.cloud.models import (
+    ServicePrincipalTokenPayload,
+    UserPrincipalTokenPayload,
+)
+from atat.domain.csp.cloud.token_cache import TokenCache
+
+
+class FakeClock:
+    def __init__(self, now=1000):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def service_principal_payload(scope="scope"):
+    return ServicePrincipalTokenPayload(
+        scope=scope, client_id="client", client_secret="secret"
+    )
+
+
+def test_key_differs_by_scope_and_username():
+    user_payload = UserPrincipalTokenPayload(
+        scope="scope",
+        client_id="client",
+        username="user",
+        password="password",  # pragma: allowlist secret
+    )
+    keys = {
+        TokenCache.key("tenant", service_principal_payload()),
+        TokenCache.key("tenant", service_principal_payload(scope="other")),
+        TokenCache.key("other_tenant", service_principal_payload()),
+        TokenCache.key("tenant", user_payload),
+    }
+    assert len(keys) == 4
+
+
+def test_returns_token_until_expiry_margin():
+    clock = FakeClock()
+    cache = TokenCache(expiry_margin=300, clock=clock)
+    cache.set("key", "token", 3600)
+
+    clock.now += 3299
+    assert cache.get("key") == "token"
+
+    clock.now += 1
+    assert cache.get("key") is None
+
+
+def test_does_not_cache_short_lived_or_unknown_expiry():
+    cache = TokenCache(expiry_margin=300)
+    cache.set("short", "token", 60)
+    cache.set("unknown", "token", None)
+
+    assert cache.get("short") is None
+    assert cache.get("unknown") is None
+
+
+def test_invalidate():
+    cache = TokenCache()
+    cache.set("key", "token", 3600)
+    cache.invalidate("key")
+
+    assert cache.get("key") is None
+
+
+def test_shares_tokens_through_redis():
+    redis = Mock()
+    store = {}
+    redis.setex.side_effect = lambda name, value, time: store.update({name: value})
+    redis.get.side_effect = store.get
+
+    TokenCache(redis=redis).set("key", "token", 3600)
+    assert redis.setex.call_args[1]["time"] == 3300
+
+    assert TokenCache(redis=redis).get("key") == "token"
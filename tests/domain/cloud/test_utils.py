@@ -10,6 +10,7 @@ from atat.domain.csp.cloud.utils import (
     get_principal_auth_token,
     make_auth_header,
 )
+from atat.domain.csp.cloud.token_cache import TokenCache
 from tests.domain.cloud.test_azure_csp import mock_requests_response
 from tests.mock_azure import mock_requests
 
@@ -33,6 +34,19 @@ def test_get_principal_auth_token(mock_requests):
     assert get_principal_auth_token("a_tenant_id", payload) is None
 
 
+@patch("atat.domain.csp.cloud.utils.requests", new_callable=mock_requests)
+def test_get_principal_auth_token_uses_token_cache(mock_requests):
+    mock_requests.post.side_effect = [
+        mock_requests_response(json_data={"access_token": "token", "expires_in": 3599}),
+    ]
+    payload = MagicMock(client_id="client", scope="scope", username="")
+    token_cache = TokenCache()
+
+    assert get_principal_auth_token("a_tenant_id", payload, token_cache) == "token"
+    assert get_principal_auth_token("a_tenant_id", payload, token_cache) == "token"
+    assert mock_requests.post.call_count == 1
+
+
 def test_make_auth_header():
     header = make_auth_header("foo")
     assert header["Authorization"] == "Bearer foo"
@@ -9,6 +9,9 @@ from azure.core.exceptions import AzureError
 from atat.domain.csp.cloud import MockCloudProvider
 from atat.domain.csp.cloud.exceptions import ConnectionException, GeneralCSPException
 from atat.domain.csp.cloud.models import (
+    ApplicationCSPResult,
+    EnvironmentCSPResult,
+    ManagementGroupCSPResponse,
     SubscriptionCreationCSPPayload,
     UserRoleCSPResult,
 )
@@ -23,6 +26,8 @@ from atat.jobs import (
     dispatch_create_environment_role,
     dispatch_create_user,
     dispatch_provision_portfolio,
+    do_check_application_creation,
+    do_check_environment_creation,
     do_create_application,
     do_create_environment,
     do_create_environment_role,
@@ -158,6 +163,129 @@ def test_create_application_job_is_idempotent(csp):
     csp.create_application.assert_not_called()
 
 
+class TestPendingManagementGroupCreation:
+    @pytest.fixture
+    def pending(self):
+        name = str(uuid4())
+        return dict(
+            id=f"/providers/Microsoft.Management/managementGroups/{name}",
+            name=name,
+            status_url="https://status.url",
+            result_url="https://result.url",
+            retry_after=10,
+        )
+
+    @pytest.fixture
+    def environment(self, session):
+        environment = EnvironmentFactory.create()
+        environment.application.cloud_id = "parentId"
+        environment.portfolio.csp_data = {"tenant_id": "fake"}
+        session.add(environment)
+        session.commit()
+        return environment
+
+    def test_create_environment_schedules_check(
+        self, session, csp, environment, pending, monkeypatch
+    ):
+        csp.create_environment.side_effect = None
+        csp.create_environment.return_value = EnvironmentCSPResult(**pending)
+        mock_apply_async = Mock()
+        monkeypatch.setattr(
+            "atat.jobs.check_environment_creation.apply_async", mock_apply_async
+        )
+
+        do_create_environment(csp, environment.id)
+        session.refresh(environment)
+
+        assert environment.cloud_id is None
+        # The environment stays claimed until the check task runs
+        assert environment.claimed_until is not None
+        mock_apply_async.assert_called_once_with(
+            kwargs=dict(
+                management_group_name=pending["name"],
+                parent_id="parentId",
+                status_url=pending["status_url"],
+                result_url=pending["result_url"],
+                environment_id=environment.id,
+            ),
+            countdown=10,
+        )
+
+    def test_check_environment_creation(
+        self, session, csp, environment, pending, monkeypatch
+    ):
+        mock_create_subscription = Mock()
+        monkeypatch.setattr(
+            "atat.jobs.create_subscription.delay", mock_create_subscription
+        )
+        environment.claimed_until = pendulum.now().add(minutes=5)
+        session.commit()
+
+        do_check_environment_creation(
+            csp,
+            environment_id=environment.id,
+            management_group_name=pending["name"],
+            parent_id="parentId",
+            status_url=pending["status_url"],
+            result_url=pending["result_url"],
+        )
+        session.refresh(environment)
+
+        assert environment.cloud_id == pending["id"]
+        assert environment.claimed_until is None
+        mock_create_subscription.assert_called_once_with(environment_id=environment.id)
+
+    def test_check_environment_creation_reschedules(
+        self, session, csp, environment, pending, monkeypatch
+    ):
+        csp.get_management_group_creation_status.side_effect = None
+        csp.get_management_group_creation_status.return_value = ManagementGroupCSPResponse(
+            **pending
+        )
+        mock_apply_async = Mock()
+        monkeypatch.setattr(
+            "atat.jobs.check_environment_creation.apply_async", mock_apply_async
+        )
+
+        do_check_environment_creation(
+            csp,
+            environment_id=environment.id,
+            management_group_name=pending["name"],
+            parent_id="parentId",
+            status_url=pending["status_url"],
+            result_url=pending["result_url"],
+        )
+        session.refresh(environment)
+
+        assert environment.cloud_id is None
+        assert environment.claimed_until is not None
+        mock_apply_async.assert_called_once()
+
+    def test_create_application_schedules_check(
+        self, session, csp, pending, monkeypatch
+    ):
+        tenant_id = str(uuid4())
+        application = ApplicationFactory.create(
+            portfolio=PortfolioFactory.create(csp_data={"tenant_id": tenant_id}),
+            cloud_id=None,
+        )
+        csp.create_application.side_effect = None
+        csp.create_application.return_value = ApplicationCSPResult(**pending)
+        monkeypatch.setattr(
+            "atat.jobs.check_application_creation.apply_async",
+            lambda kwargs, countdown: do_check_application_creation(csp, **kwargs),
+        )
+
+        do_create_application(csp, application.id)
+        session.refresh(application)
+
+        assert application.cloud_id == pending["id"]
+        assert application.claimed_until is None
+        payload = csp.get_management_group_creation_status.call_args[0][0]
+        assert payload.tenant_id == tenant_id
+        assert payload.status_url == pending["status_url"]
+
+
 class TestCreateUserJob:
     @pytest.fixture
     def portfolio(self, app):